@@ -23,13 +23,16 @@ from app.views import (
 # ── Application setup ───────────────────────────────────────────────
 
 app = QuickAPI("demo-app", debug=True)
+app.configure({"cache.invalidation_debounce": 300})
 
-db = DatabaseConnection("app.db")
+db = DatabaseConnection("app.db", pool_min=4, pool_max=16)
 db.connect()
 
 templates = TemplateEngine(template_dir="templates")
 token_validator = TokenValidator(secret_key="supersecret")
-cache = CacheManager()
+cache = CacheManager(
+    invalidation_debounce=app.get_config("cache.invalidation_debounce", 300),
+)
 
 # ── Route registration ──────────────────────────────────────────────
 
@@ -41,12 +44,12 @@ def handle_search_users(request):
 
 @app.route("/api/users/<user_id>", methods=["GET"])
 def handle_get_user(request):
-    return get_user_profile(request, db, templates)
+    return get_user_profile(request, db, templates, cache)
 
 
 @app.route("/api/users/<user_id>", methods=["POST"])
 def handle_update_profile(request):
-    return update_profile(request, db)
+    return update_profile(request, db, cache)
 
 
 @app.route("/admin/diagnostics", methods=["GET"])
@@ -1,8 +1,10 @@
 """
 View handlers for the demo application.
 
-Each function here contains an INTENTIONAL VULNERABILITY that CodeQL
-should detect — but only AFTER the QuickAPI framework has been modeled.
+Each numbered handler here contains an INTENTIONAL VULNERABILITY that
+CodeQL should detect — but only AFTER the QuickAPI framework has been
+modeled. The page-rendering handlers at the bottom escape their output
+and are not part of the exercise.
 
 There are 5 intentional vulnerabilities in this file, plus 1 bonus
 finding (Polynomial ReDoS) that CodeQL detects automatically once
@@ -14,10 +16,25 @@ Without models, CodeQL does not know that:
   - Sanitizer methods propagate taint (summaries)
 """
 
+import html
+
 from quickapi.request import Request
-from quickapi.response import Response, JSONResponse
-from quickapi.database import DatabaseConnection
+from quickapi.response import JSONResponse, HTMLResponse, StreamingResponse
+from quickapi.database import DatabaseConnection, QueryBuilder
+from quickapi.templating import TemplateEngine
 from quickapi.security import SystemHelper, Sanitizer, TokenValidator
+from quickapi.utils import CacheManager
+
+# Page templates are module constants so TemplateEngine compiles each once.
+PROFILE_TEMPLATE = "<h1>{{username}}</h1><p>{{bio}}</p>"
+DASHBOARD_TEMPLATE = "<h1>Dashboard</h1><p>{{greeting}}</p>"
+
+# The profile lookup has a fixed shape, so its SQL is built once.
+PROFILE_SQL = QueryBuilder("users").select("username", "bio").where_raw("id = ?").build()
+
+# Constant responses are encoded once; handlers return copies.
+_RESP_UPDATED = JSONResponse({"status": "updated"})
+_RESP_NOT_FOUND = JSONResponse({"error": "not found"}, status_code=404)
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -59,24 +76,25 @@ def admin_diagnostics(request: Request) -> JSONResponse:
 # 3. Path Traversal
 # ────────────────────────────────────────────────────────────────────
 
-def download_report(request: Request) -> Response:
+def download_report(request: Request) -> StreamingResponse:
     """
     VULNERABILITY: Path Traversal
 
-    The `filename` query parameter flows into `SystemHelper.read_file()`,
+    The `filename` query parameter flows into `SystemHelper.open_file()`,
     allowing an attacker to read arbitrary files.
-    CodeQL needs to know that `read_file()` is a path-injection sink.
+    CodeQL needs to know that `open_file()` is a path-injection sink.
     """
     filename = request.get_query_param("filename")
-    content = SystemHelper.read_file(f"reports/{filename}")
-    return Response(body=content, content_type="text/plain")
+    chunks = SystemHelper.open_file(f"reports/{filename}")
+    return StreamingResponse(chunks, content_type="text/plain")
 
 
 # ────────────────────────────────────────────────────────────────────
 # 4. SQL Injection with taint flowing through a summary (Sanitizer)
 # ────────────────────────────────────────────────────────────────────
 
-def update_profile(request: Request, db: DatabaseConnection) -> JSONResponse:
+def update_profile(request: Request, db: DatabaseConnection,
+                   cache: CacheManager) -> JSONResponse:
     """
     VULNERABILITY: SQL Injection (taint through summary)
 
@@ -96,8 +114,9 @@ def update_profile(request: Request, db: DatabaseConnection) -> JSONResponse:
     user_id = request.get_query_param("user_id")
     sql = f"UPDATE users SET bio = '{cleaned_bio}' WHERE id = {user_id}"
     db.execute_update(sql)
+    cache.invalidate(["users"])
 
-    return JSONResponse({"status": "updated"})
+    return _RESP_UPDATED.copy()
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -121,4 +140,37 @@ def login(request: Request, db: DatabaseConnection, validator: TokenValidator) -
 
     if results:
         return JSONResponse({"user": results[0]})
-    return JSONResponse({"error": "not found"}, status_code=404)
+    return _RESP_NOT_FOUND.copy()
+
+
+# ────────────────────────────────────────────────────────────────────
+# Page rendering (not vulnerable — values are escaped before rendering)
+# ────────────────────────────────────────────────────────────────────
+
+def get_user_profile(request: Request, db: DatabaseConnection,
+                     templates: TemplateEngine, cache: CacheManager) -> HTMLResponse:
+    """Render a user's public profile page."""
+    user_id = request.get_path_param("user_id")
+    cache_key = f"profile:{user_id}"
+    page = cache.get(cache_key)
+    if page is None:
+        rows = db.execute_query(PROFILE_SQL, (user_id,))
+        if not rows:
+            return HTMLResponse("<h1>User not found</h1>", status_code=404)
+        page = templates.render_string(
+            PROFILE_TEMPLATE, {key: html.escape(str(value)) for key, value in rows[0].items()}
+        )
+        cache.set(cache_key, page, tags=["users"])
+    return HTMLResponse(page)
+
+
+def render_dashboard(request: Request, templates: TemplateEngine,
+                     cache: CacheManager) -> HTMLResponse:
+    """Render the dashboard with an optional welcome message."""
+    welcome = request.get_query_param("welcome_msg", "Welcome back!")
+    page = cache.get_or_compute(
+        f"dash:{welcome}",
+        lambda: templates.render_string(DASHBOARD_TEMPLATE, {"greeting": html.escape(welcome)}),
+        ttl=60,
+    )
+    return HTMLResponse(page)
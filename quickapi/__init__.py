@@ -8,8 +8,8 @@ Model Editor in VS Code.
 
 from quickapi.app import QuickAPI
 from quickapi.request import Request
-from quickapi.response import Response, JSONResponse, HTMLResponse
-from quickapi.database import DatabaseConnection, QueryBuilder
+from quickapi.response import Response, JSONResponse, HTMLResponse, StreamingResponse
+from quickapi.database import DatabaseConnection, QueryBuilder, ResultSet
 from quickapi.templating import TemplateEngine
 from quickapi.security import TokenValidator, Sanitizer
 from quickapi.utils import DataTransformer, CacheManager
@@ -21,8 +21,10 @@ __all__ = [
     "Response",
     "JSONResponse",
     "HTMLResponse",
+    "StreamingResponse",
     "DatabaseConnection",
     "QueryBuilder",
+    "ResultSet",
     "TemplateEngine",
     "TokenValidator",
     "Sanitizer",
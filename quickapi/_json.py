@@ -0,0 +1,148 @@
+"""
+JSON codec used throughout QuickAPI.
+
+Uses orjson, then ujson, when installed, and the standard library
+otherwise. Set QUICKAPI_JSON_BACKEND to "orjson", "ujson" or "json" to pin
+a backend (e.g. so tests see stdlib output).
+
+Single-field lookups (`pointer_reader`) use pysimdjson when it is
+installed, so only the values actually read are materialised.
+"""
+
+import functools
+import importlib
+import json
+import os
+import re
+from typing import Any, Callable, Mapping, Optional, Sequence, Union
+
+try:
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
+
+
+def _load_backend(requested: str):
+    """Return (name, module) for the first importable backend."""
+    if requested not in ("", "orjson", "ujson", "json"):
+        raise ImportError(f"Unknown QUICKAPI_JSON_BACKEND: {requested!r}")
+    for name in (requested,) if requested else ("orjson", "ujson"):
+        if name == "json":
+            break
+        try:
+            return name, importlib.import_module(name)
+        except ImportError:
+            if requested:
+                raise
+    return "json", json
+
+
+BACKEND, _impl = _load_backend(os.environ.get("QUICKAPI_JSON_BACKEND", "").strip().lower())
+
+
+def _with_container_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """
+    Encode any Mapping (e.g. MappingProxyType) as an object and any other
+    Sequence (e.g. a database ResultSet) as an array, then defer to `default`.
+    """
+    def fallback(obj: Any) -> Any:
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes, bytearray)):
+            return list(obj)
+        if default is not None:
+            return default(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return fallback
+
+
+def make_dumps(default: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], str]:
+    """
+    Return a `dumps(obj) -> str` function for the active backend.
+
+    `default` is called for objects the backend cannot serialise; any
+    `Mapping` or `Sequence` is already encoded as an object or array. Build the function once and
+    reuse it; configuring an encoder is not free.
+    """
+    default = _with_container_default(default)
+    if BACKEND == "orjson":
+        option = _impl.OPT_NON_STR_KEYS
+        return lambda obj: _impl.dumps(obj, default=default, option=option).decode()
+    if BACKEND == "ujson":
+        return lambda obj: _impl.dumps(obj, default=default)
+    return json.JSONEncoder(default=default).encode
+
+
+def make_dumps_bytes(default: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bytes]:
+    """
+    Like `make_dumps`, but the function returns UTF-8 bytes ready to send.
+
+    orjson produces bytes natively, so no str round trip happens there.
+    """
+    if BACKEND == "orjson":
+        default = _with_container_default(default)
+        option = _impl.OPT_NON_STR_KEYS
+        return lambda obj: _impl.dumps(obj, default=default, option=option)
+    dumps_str = make_dumps(default)
+    return lambda obj: dumps_str(obj).encode()
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document; bytes input is accepted without decoding first."""
+    if BACKEND == "ujson" and isinstance(data, bytearray):
+        data = bytes(data)
+    return _impl.loads(data)
+
+
+dumps = make_dumps()
+
+_ARRAY_INDEX_RE = re.compile(r"0|[1-9][0-9]*")
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """
+    Look up an RFC 6901 JSON Pointer such as "/user/tags/0" in parsed JSON.
+
+    Raises LookupError, ValueError or TypeError if the path does not exist.
+    """
+    if not pointer:
+        return document
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSON pointer must start with '/': {pointer!r}")
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(document, list):
+            # RFC 6901 array indices: no sign, no leading zeros.
+            if not _ARRAY_INDEX_RE.fullmatch(token):
+                raise IndexError(f"invalid JSON pointer array index: {token!r}")
+            document = document[int(token)]
+        else:
+            document = document[token]
+    return document
+
+
+def pointer_reader(data: Any) -> Callable[[str], Any]:
+    """
+    Return a `read(pointer)` function over a JSON document.
+
+    With pysimdjson, `data` is parsed into a reusable tape and values are
+    only converted to Python objects when read. Otherwise it is parsed
+    once in full. Already-decoded objects are read as they are.
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        if _simdjson is not None:
+            parser = _simdjson.Parser()
+            document = parser.parse(bytes(data) if isinstance(data, bytearray) else data)
+            return functools.partial(_read_simdjson, parser, document)
+        data = loads(data)
+    return functools.partial(resolve_pointer, data)
+
+
+def _read_simdjson(parser: Any, document: Any, pointer: str) -> Any:
+    # `parser` is bound here only to keep the document's buffer alive.
+    value = document.at_pointer(pointer) if pointer else document
+    if isinstance(value, _simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, _simdjson.Array):
+        return value.as_list()
+    return value
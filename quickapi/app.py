@@ -2,8 +2,29 @@
 Core application class for QuickAPI framework.
 """
 
+import functools
+import inspect
 import json
-from typing import Callable, Dict, Any, Optional
+import re
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+_PARAM_RE = re.compile(r"<(\w+)>")
+
+
+def _compile_path(path: str) -> "re.Pattern":
+    """Turn "/users/<user_id>" into an anchored regex with named groups."""
+    pattern = ""
+    pos = 0
+    for match in _PARAM_RE.finditer(path):
+        pattern += re.escape(path[pos:match.start()]) + f"(?P<{match.group(1)}>[^/]+)"
+        pos = match.end()
+    return re.compile("^" + pattern + re.escape(path[pos:]) + "$")
+
+
+def _require_sync(func: Callable, kind: str):
+    """Reject coroutine functions: dispatch calls handlers and middleware directly."""
+    if inspect.iscoroutinefunction(func):
+        raise TypeError(f"{kind} {func.__name__!r} must be a plain function, not async def")
 
 
 class QuickAPI:
@@ -12,7 +33,10 @@ class QuickAPI:
     def __init__(self, app_name: str, debug: bool = False):
         self.app_name = app_name
         self.debug = debug
-        self._routes: Dict[str, Dict[str, Callable]] = {}
+        # Parameter-free paths are an exact dict hit; the rest are matched
+        # against patterns compiled once at registration.
+        self._static: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._dynamic: Dict[str, List[Tuple["re.Pattern", Dict[str, Any]]]] = {}
         self._middleware: list = []
         self._config: Dict[str, Any] = {}
 
@@ -22,16 +46,46 @@ class QuickAPI:
             methods = ["GET"]
 
         def decorator(func: Callable):
+            _require_sync(func, "route handler")
+            pattern = _compile_path(path) if _PARAM_RE.search(path) else None
             for method in methods:
-                key = f"{method.upper()}:{path}"
-                self._routes[key] = {"handler": func, "path": path, "method": method}
+                method = method.upper()
+                route = {"handler": func, "path": path, "method": method,
+                         "pipeline": self._build_pipeline(func)}
+                if pattern is None:
+                    self._static[(method, path)] = route
+                else:
+                    self._dynamic.setdefault(method, []).append((pattern, route))
             return func
 
         return decorator
 
     def add_middleware(self, middleware_func: Callable):
-        """Add middleware to the request processing pipeline."""
+        """
+        Add middleware to the request processing pipeline.
+
+        Middleware is called as `middleware_func(request, next=...)` and
+        continues the chain by calling `next(request)`. Middleware added
+        first runs outermost. Each route's chain is rebuilt here, so
+        dispatch makes a single call instead of walking the list.
+        """
+        _require_sync(middleware_func, "middleware")
         self._middleware.append(middleware_func)
+        for route in self._iter_routes():
+            route["pipeline"] = self._build_pipeline(route["handler"])
+
+    def _build_pipeline(self, handler: Callable) -> Callable:
+        """Wrap `handler` in the current middleware, innermost last."""
+        pipeline = handler
+        for middleware in reversed(self._middleware):
+            pipeline = functools.partial(middleware, next=pipeline)
+        return pipeline
+
+    def _iter_routes(self) -> Iterator[Dict[str, Any]]:
+        yield from self._static.values()
+        for patterns in self._dynamic.values():
+            for _, route in patterns:
+                yield route
 
     def configure(self, config: Dict[str, Any]):
         """Load application configuration."""
@@ -43,10 +97,15 @@ class QuickAPI:
 
     def dispatch(self, method: str, path: str, request) -> Any:
         """Dispatch a request to the appropriate handler."""
-        key = f"{method.upper()}:{path}"
-        route = self._routes.get(key)
+        method = method.upper()
+        route = self._static.get((method, path))
         if route:
-            return route["handler"](request)
+            return route["pipeline"](request)
+        for pattern, route in self._dynamic.get(method, ()):
+            match = pattern.match(path)
+            if match:
+                request.set_path_params(match.groupdict())
+                return route["pipeline"](request)
         return None
 
     def run(self, host: str = "0.0.0.0", port: int = 8080):
@@ -6,44 +6,171 @@ When modeling this framework, the query string parameters should be
 modeled as SQL-injection sinks.
 """
 
+import queue
 import sqlite3
-from typing import Any, Dict, List, Optional
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Any, ContextManager, Iterator, List, Optional, Tuple
+
+
+# Per-connection sqlite settings: compiled statements kept per connection
+# (keyed on SQL text), and page cache size in KiB.
+_STATEMENT_CACHE_SIZE = 512
+_PAGE_CACHE_KIB = 64000
+
+
+class _ConnectionPool:
+    """
+    A bounded pool of sqlite3 connections shared across threads.
+
+    `min_size` connections are opened up front; more are opened on demand
+    up to `max_size`, after which `acquire()` blocks until one is released.
+    Connections are reused LIFO so the most recently used (warmest) one is
+    handed out first.
+    """
+
+    def __init__(self, connection_string: str, min_size: int, max_size: int):
+        self._connection_string = connection_string
+        self._max_size = max(1, max_size)
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        for _ in range(min(min_size, self._max_size)):
+            self._idle.put(self._open())
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._connection_string,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        # WAL lets readers proceed while another connection is writing.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA cache_size=-{_PAGE_CACHE_KIB}")
+        self._all.append(conn)
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the `with` block."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = len(self._all) < self._max_size
+                conn = self._open() if grow else None
+            if conn is None:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close every connection the pool has opened."""
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+            self._idle = queue.LifoQueue()
+
+
+class ResultSet(Sequence):
+    """
+    Rows returned by `DatabaseConnection.execute_query`.
+
+    Rows are kept as the tuples sqlite produces; the dict for a row is only
+    built when that row is accessed, so large result sets that are counted,
+    sliced or serialised column-wise never allocate one dict per row.
+    """
+
+    def __init__(self, columns: List[str], rows: List[Tuple[Any, ...]]):
+        self.columns = columns
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [dict(zip(self.columns, row)) for row in self.rows[index]]
+        return dict(zip(self.columns, self.rows[index]))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ResultSet):
+            return self.columns == other.columns and self.rows == other.rows
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def column(self, name: str) -> List[Any]:
+        """Return every value of one column, in row order."""
+        return list(map(itemgetter(self.columns.index(name)), self.rows))
+
+    def __repr__(self) -> str:
+        return f"ResultSet(columns={self.columns!r}, rows={len(self.rows)})"
 
 
 class DatabaseConnection:
     """
-    A simple database connection wrapper.
+    A simple database connection wrapper backed by a connection pool.
 
     Methods that accept raw SQL strings are potential SQL-injection sinks.
     """
 
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, pool_min: int = 4, pool_max: int = 16):
         self._connection_string = connection_string
-        self._connection: Optional[sqlite3.Connection] = None
+        if connection_string == ":memory:":
+            # Every in-memory connection is a separate database.
+            pool_min = pool_max = 1
+        self._pool_min = pool_min
+        self._pool_max = pool_max
+        self._pool: Optional[_ConnectionPool] = None
 
     def connect(self):
-        """Open the database connection."""
-        self._connection = sqlite3.connect(self._connection_string)
+        """Open the connection pool."""
+        if self._pool is None:
+            self._pool = _ConnectionPool(self._connection_string, self._pool_min, self._pool_max)
 
     def close(self):
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
+        """Close all pooled connections."""
+        if self._pool:
+            self._pool.close()
+            self._pool = None
+
+    def _acquire(self) -> ContextManager[sqlite3.Connection]:
+        if self._pool is None:
+            self.connect()
+        return self._pool.acquire()
 
     # ── SQL-injection sinks ─────────────────────────────────────────
 
-    def execute_query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    def execute_query(self, sql: str, params: tuple = ()) -> ResultSet:
         """
-        Execute a SQL query and return results as a list of dicts.
+        Execute a SQL query and return the rows as a sequence of dicts.
 
         `sql` is a SINK for sql-injection when constructed from user input.
         """
-        if not self._connection:
-            self.connect()
-        cursor = self._connection.cursor()
-        cursor.execute(sql, params)
-        columns = [desc[0] for desc in cursor.description or []]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            columns = [desc[0] for desc in cursor.description or []]
+            return ResultSet(columns, cursor.fetchall())
+
+    def execute_prepared(self, sql_template: str, params: tuple) -> ResultSet:
+        """
+        Execute a parameterised statement, e.g. ("... WHERE id = ?", (user_id,)).
+
+        Each pooled connection keeps its compiled statements keyed on the SQL
+        text, so a constant `sql_template` is parsed and planned only once
+        per connection; values go in `params`, never in the string.
+
+        `sql_template` is a SINK for sql-injection when constructed from user input.
+        """
+        return self.execute_query(sql_template, params)
 
     def execute_update(self, sql: str, params: tuple = ()) -> int:
         """
@@ -51,12 +178,11 @@ class DatabaseConnection:
 
         `sql` is a SINK for sql-injection when constructed from user input.
         """
-        if not self._connection:
-            self.connect()
-        cursor = self._connection.cursor()
-        cursor.execute(sql, params)
-        self._connection.commit()
-        return cursor.rowcount
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            conn.commit()
+            return cursor.rowcount
 
     def execute_raw(self, sql: str) -> Any:
         """
@@ -64,11 +190,10 @@ class DatabaseConnection:
 
         `sql` is a SINK for sql-injection.
         """
-        if not self._connection:
-            self.connect()
-        cursor = self._connection.cursor()
-        cursor.executescript(sql)
-        return cursor.fetchall()
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            cursor.executescript(sql)
+            return cursor.fetchall()
 
 
 class QueryBuilder:
@@ -5,8 +5,25 @@ These classes represent SOURCES of user-controlled data. When modeling this
 framework, the methods that return user input should be modeled as taint sources.
 """
 
-from typing import Any, Dict, Optional
-import json
+import functools
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from quickapi import _json
+
+# Marks "not parsed yet", since None is a valid parsed JSON body.
+_UNSET = object()
+
+# Lower-cased, interned header names, keyed on the spelling callers use.
+_HEADER_NAME_CACHE: Dict[str, str] = {
+    name: sys.intern(name.lower())
+    for name in (
+        "Accept", "Authorization", "Content-Length", "Content-Type", "Cookie",
+        "Host", "Origin", "Referer", "User-Agent", "X-Forwarded-For",
+    )
+}
+_HEADER_NAME_CACHE.update({key: key for key in list(_HEADER_NAME_CACHE.values())})
 
 
 class Request:
@@ -18,14 +35,27 @@ class Request:
     and should be considered UNTRUSTED.
     """
 
+    __slots__ = (
+        "_environ", "_headers", "_query_params", "_body", "_form_data",
+        "_cookies", "_files", "_path_params", "_parsed_body", "_json_reader",
+    )
+
     def __init__(self, environ: Optional[Dict[str, Any]] = None):
         self._environ = environ or {}
-        self._headers = self._environ.get("headers", {})
+        self._headers = {k.lower(): v for k, v in self._environ.get("headers", {}).items()}
         self._query_params = self._environ.get("query_params", {})
+        # The body may be str or the raw bytes read off the socket.
         self._body = self._environ.get("body", "")
         self._form_data = self._environ.get("form_data", {})
         self._cookies = self._environ.get("cookies", {})
         self._files = self._environ.get("files", {})
+        self._path_params: Dict[str, str] = {}
+        self._parsed_body: Any = _UNSET
+        self._json_reader: Optional[Callable[[str], Any]] = None
+
+    def set_path_params(self, params: Dict[str, str]):
+        """Record the values captured from the matched route's <param> segments."""
+        self._path_params = params
 
     # ── Sources of user-controlled data ─────────────────────────────
 
@@ -33,22 +63,54 @@ class Request:
         """Return a single query-string parameter value (SOURCE)."""
         return self._query_params.get(name, default)
 
-    def get_all_query_params(self) -> Dict[str, str]:
-        """Return all query-string parameters (SOURCE)."""
-        return dict(self._query_params)
+    def get_path_param(self, name: str, default: str = "") -> str:
+        """Return a value captured from the URL path, e.g. <user_id> (SOURCE)."""
+        return self._path_params.get(name, default)
+
+    def get_all_query_params(self) -> Mapping[str, str]:
+        """Return a read-only view of all query-string parameters (SOURCE)."""
+        return MappingProxyType(self._query_params)
 
     def get_header(self, name: str, default: str = "") -> str:
         """Return a single HTTP header value (SOURCE)."""
-        return self._headers.get(name.lower(), default)
+        key = _HEADER_NAME_CACHE.get(name)
+        if key is None:
+            key = _HEADER_NAME_CACHE[name] = sys.intern(name.lower())
+        return self._headers.get(key, default)
 
     def get_json_body(self) -> Any:
-        """Parse and return the JSON request body (SOURCE)."""
-        if isinstance(self._body, str):
-            return json.loads(self._body) if self._body else {}
-        return self._body
+        """
+        Parse and return the JSON request body (SOURCE).
+
+        The body is parsed on first call; later calls return the same object.
+        """
+        if self._parsed_body is _UNSET:
+            if isinstance(self._body, (str, bytes, bytearray)):
+                self._parsed_body = _json.loads(self._body) if self._body else {}
+            else:
+                self._parsed_body = self._body
+        return self._parsed_body
+
+    def get_json_field(self, pointer: str, default: Any = None) -> Any:
+        """
+        Return one value from the JSON body by JSON Pointer, e.g. "/user/bio" (SOURCE).
+
+        Cheaper than `get_json_body` when only a few fields are needed.
+        """
+        if self._json_reader is None:
+            if self._parsed_body is _UNSET:
+                self._json_reader = _json.pointer_reader(self._body or "{}")
+            else:
+                self._json_reader = functools.partial(_json.resolve_pointer, self._parsed_body)
+        try:
+            return self._json_reader(pointer)
+        except (LookupError, ValueError, TypeError):
+            return default
 
     def get_raw_body(self) -> str:
         """Return the raw request body as a string (SOURCE)."""
+        if isinstance(self._body, (bytes, bytearray)):
+            return self._body.decode()
         return self._body
 
     def get_form_field(self, name: str, default: str = "") -> str:
@@ -2,27 +2,144 @@
 Response classes for QuickAPI framework.
 """
 
-import json
-from typing import Any, Dict, Optional
+import copy
+from datetime import datetime
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from quickapi import _json
+
+
+# Built once: configuring an encoder on every call is not free.
+_dumps = _json.make_dumps_bytes()
+
+# Encoded "status line + Content-Type" prefixes, keyed on (status, content type).
+_HEADER_CACHE: Dict[Tuple[int, str], bytes] = {}
+
+
+def _head_prefix(status_code: int, content_type: str) -> bytes:
+    """Return the encoded status line and Content-Type header, memoized."""
+    prefix = _HEADER_CACHE.get((status_code, content_type))
+    if prefix is None:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ""
+        prefix = f"HTTP/1.1 {status_code} {reason}\r\nContent-Type: {content_type}\r\n".encode()
+        _HEADER_CACHE[(status_code, content_type)] = prefix
+    return prefix
+
+
+for _status in (200, 404, 500):
+    for _content_type in ("application/json", "text/html", "text/plain"):
+        _head_prefix(_status, _content_type)
+del _status, _content_type
+
+
+def _cookie_flags(path: Optional[str], secure: bool, httponly: bool,
+                  samesite: Optional[str]) -> str:
+    """Build the "; Path=...; Secure; ..." suffix for a cookie."""
+    parts = []
+    if path is not None:
+        parts.append(f"; Path={path}")
+    if secure:
+        parts.append("; Secure")
+    if httponly:
+        parts.append("; HttpOnly")
+    if samesite is not None:
+        parts.append(f"; SameSite={samesite}")
+    return "".join(parts)
+
+
+# Suffixes for the common combinations (no path or Path=/), keyed on
+# (path, secure, httponly, samesite). Only these are memoized, so
+# arbitrary paths cannot grow the table.
+_COOKIE_FLAGS: Dict[Tuple[Optional[str], bool, bool, Optional[str]], str] = {
+    (path, secure, httponly, samesite): _cookie_flags(path, secure, httponly, samesite)
+    for path in (None, "/")
+    for secure in (False, True)
+    for httponly in (False, True)
+    for samesite in (None, "Lax", "Strict", "None")
+}
 
 
 class Response:
     """Base HTTP response."""
 
-    def __init__(self, body: str = "", status_code: int = 200, content_type: str = "text/plain"):
+    __slots__ = ("body", "status_code", "content_type", "_headers")
+
+    def __init__(self, body: Union[str, bytes] = "", status_code: int = 200,
+                 content_type: str = "text/plain"):
         self.body = body
         self.status_code = status_code
         self.content_type = content_type
         self._headers: Dict[str, str] = {"Content-Type": content_type}
 
+    def copy(self) -> "Response":
+        """
+        Return an independent copy of this response.
+
+        The body is shared as-is (no re-encoding); headers are copied so the
+        clone can be modified without touching the original. This lets
+        views build constant responses once at import time.
+        """
+        clone = copy.copy(self)
+        clone._headers = dict(self._headers)
+        return clone
+
+    def encode(self) -> bytes:
+        """Serialise the status line, headers and body for the wire."""
+        body = self.body if isinstance(self.body, bytes) else self.body.encode()
+        return self._encode_head(b"Content-Length: %d\r\n" % len(body)) + body
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        """Yield the wire form of the response in pieces."""
+        yield self.encode()
+
+    def _encode_head(self, framing: bytes) -> bytes:
+        """Status line and headers, ending with `framing` and the blank line."""
+        content_type = self._headers.get("Content-Type", self.content_type)
+        head = _head_prefix(self.status_code, content_type)
+        extra = "".join(
+            f"{name}: {value}\r\n" for name, value in self._headers.items() if name != "Content-Type"
+        )
+        if extra:
+            head += extra.encode()
+        return head + framing + b"\r\n"
+
     def set_header(self, name: str, value: str):
         """Set a response header."""
         self._headers[name] = value
 
-    def set_cookie(self, name: str, value: str, **kwargs):
-        """Set a cookie on the response."""
-        cookie_str = f"{name}={value}"
-        self._headers["Set-Cookie"] = cookie_str
+    def set_cookie(self, name: str, value: str, *, path: Optional[str] = None,
+                   secure: bool = False, httponly: bool = False,
+                   samesite: Optional[str] = None, max_age: Optional[int] = None,
+                   expires: Union[str, datetime, None] = None, domain: Optional[str] = None,
+                   **kwargs):
+        """
+        Set a cookie on the response.
+
+        Attributes left as `None`/`False` are omitted. `expires` may be a
+        preformatted HTTP date or a timezone-aware datetime. Other keyword
+        arguments are accepted and ignored.
+        """
+        key = (path, secure, httponly, samesite)
+        flags = _COOKIE_FLAGS.get(key)
+        if flags is None:
+            flags = _cookie_flags(*key)
+        cookie = f"{name}={value}"
+        if domain is not None:
+            cookie += f"; Domain={domain}"
+        if max_age is not None:
+            cookie += f"; Max-Age={int(max_age)}"
+        if expires is not None:
+            if isinstance(expires, datetime):
+                if expires.utcoffset() is None:
+                    raise ValueError("expires must be a timezone-aware datetime")
+                expires = formatdate(expires.timestamp(), usegmt=True)
+            cookie += f"; Expires={expires}"
+        self._headers["Set-Cookie"] = cookie + flags
 
     def redirect(self, url: str, permanent: bool = False):
         """Redirect to another URL (potential open-redirect SINK)."""
@@ -31,10 +148,12 @@ class Response:
 
 
 class JSONResponse(Response):
-    """JSON HTTP response."""
+    """JSON HTTP response; `body` holds the encoded UTF-8 bytes."""
+
+    __slots__ = ("data",)
 
     def __init__(self, data: Any, status_code: int = 200):
-        body = json.dumps(data)
+        body = _dumps(data)
         super().__init__(body=body, status_code=status_code, content_type="application/json")
         self.data = data
 
@@ -42,5 +161,35 @@ class JSONResponse(Response):
 class HTMLResponse(Response):
     """HTML HTTP response — body is rendered directly into the page (SINK for XSS)."""
 
+    __slots__ = ()
+
     def __init__(self, html_content: str, status_code: int = 200):
         super().__init__(body=html_content, status_code=status_code, content_type="text/html")
+
+
+class StreamingResponse(Response):
+    """
+    HTTP response whose body is produced incrementally.
+
+    `chunks` is an iterable of bytes that the server writes out as it is
+    consumed, so the full body never has to be held in memory.
+    """
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks: Iterable[bytes], status_code: int = 200,
+                 content_type: str = "application/octet-stream"):
+        super().__init__(body="", status_code=status_code, content_type=content_type)
+        self.chunks = chunks
+
+    def encode(self) -> bytes:
+        """Serialise the whole response; consumes `chunks`."""
+        return b"".join(self.iter_encoded())
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        """Yield the head, then each chunk with HTTP/1.1 chunked framing."""
+        yield self._encode_head(b"Transfer-Encoding: chunked\r\n")
+        for chunk in self.chunks:
+            if chunk:
+                yield b"%x\r\n%s\r\n" % (len(chunk), chunk)
+        yield b"0\r\n\r\n"
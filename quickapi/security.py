@@ -5,17 +5,184 @@ Contains both sinks (things that consume sensitive operations) and
 summaries (things that transform data while preserving taint).
 """
 
+import atexit
+import base64
+import binascii
+import copy
+import functools
 import hashlib
 import hmac
+import ipaddress
+import json
+import os
+import queue
+import re
 import subprocess
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+_TAG_RE = re.compile(r"<[^>]*>")
+
+# Commands made only of these characters split into the same argv with or
+# without a shell, so they can be executed directly.
+_PLAIN_COMMAND_RE = re.compile(r"[\w\-./:,@+% ]+")
+
+_HOSTNAME_RE = re.compile(
+    r"\A(?=.{1,253}\Z)[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+    r"(?:\.[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*\Z",
+    re.IGNORECASE,
+)
+
+
+def _iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yield `f` in `chunk_size` pieces, closing it when done or closed."""
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class _LogWriter:
+    """
+    Background writer that batches log lines.
+
+    `write_log` only enqueues; a daemon thread drains up to `max_batch`
+    pending lines at a time and writes each file's share with a single
+    `os.write`, so concurrent callers share one syscall instead of one each.
+
+    Files are opened with O_APPEND, so each batch lands at the end of the
+    file even if another process appends to it too. Descriptors stay open
+    between batches while traffic keeps arriving and are closed once the
+    writer has been idle for `idle_close` seconds, which also lets external
+    log rotation take effect, and at interpreter exit.
+    """
+
+    def __init__(self, max_batch: int = 256, idle_close: float = 1.0, max_open: int = 32):
+        self._queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._max_batch = max_batch
+        self._idle_close = idle_close
+        self._max_open = max_open
+        self._fds: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, logfile: str, line: str):
+        """Queue `line` to be appended to `logfile`."""
+        if not self._alive():
+            self._start()
+        self._queue.put((logfile, line))
+
+    def flush(self):
+        """
+        Block until every queued line has been written.
+
+        Returns early if the writer thread is not running, since nothing
+        would ever drain the queue.
+        """
+        done = self._queue.all_tasks_done
+        with done:
+            while self._queue.unfinished_tasks and self._alive():
+                done.wait(0.1)
+
+    def _alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _start(self):
+        with self._lock:
+            if not self._alive():
+                if self._thread is None:
+                    atexit.register(self._shutdown)
+                self._thread = threading.Thread(
+                    target=self._run, name="quickapi-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _shutdown(self):
+        self.flush()
+        with self._lock:
+            self._close_files()
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self._idle_close)
+            except queue.Empty:
+                with self._lock:
+                    self._close_files()
+                first = self._queue.get()
+            batch = [first]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._lock:
+                    self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[str, str]]):
+        by_file: Dict[str, List[str]] = {}
+        for logfile, line in batch:
+            by_file.setdefault(logfile, []).append(line)
+        for logfile, lines in by_file.items():
+            try:
+                fd = self._fds.get(logfile)
+                if fd is None:
+                    if len(self._fds) >= self._max_open:
+                        self._close_files()
+                    fd = self._fds[logfile] = os.open(
+                        logfile, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                    )
+                # Messages are user data; lone surrogates must not abort the batch.
+                payload = "".join(lines).encode("utf-8", "backslashreplace")
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+            except Exception:
+                # Nobody is waiting on the result; drop this file's lines
+                # rather than losing the writer thread.
+                fd = self._fds.pop(logfile, None)
+                if fd is not None:
+                    os.close(fd)
+
+    def _close_files(self):
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+
+_log_writer = _LogWriter()
 
 
 class TokenValidator:
-    """Validates and decodes authentication tokens."""
+    """
+    Validates and decodes authentication tokens.
 
-    def __init__(self, secret_key: str):
+    Decoded claims are cached per token string, since a client replays the
+    same token on every request. Tokens that fail to decode are remembered
+    in a smaller, separate cache so that probing with garbage tokens cannot
+    evict valid sessions. Both caches are dropped by `rotate_secret`.
+    """
+
+    __slots__ = (
+        "_secret_key", "_cache_size", "_rejected_cache_size", "_cached_decode", "_rejected",
+    )
+
+    def __init__(self, secret_key: str, cache_size: int = 8192, rejected_cache_size: int = 1024):
+        self._secret_key = secret_key
+        self._cache_size = cache_size
+        self._rejected_cache_size = rejected_cache_size
+        self._reset_caches()
+
+    def rotate_secret(self, secret_key: str):
+        """Switch to a new secret key and forget every cached decode."""
         self._secret_key = secret_key
+        self._reset_caches()
 
     def decode_token(self, token: str) -> dict:
         """
@@ -24,21 +191,51 @@ class TokenValidator:
         The returned dict contains user-controlled data from the token —
         this is a SOURCE of taint (remote user data embedded in the token).
         """
-        # Simplified token "decoding" for demo purposes
-        import base64
-        import json
-
-        try:
-            parts = token.split(".")
-            payload = base64.b64decode(parts[1] + "==")
-            return json.loads(payload)
-        except (IndexError, Exception):
+        claims = self._lookup(token)
+        if claims is None:
             return {}
+        # Hand out a copy so callers cannot alter the cached claims; nested
+        # objects and arrays need a deep copy, flat claims do not.
+        if any(isinstance(value, (dict, list)) for value in claims.values()):
+            return copy.deepcopy(claims)
+        return dict(claims)
 
     def get_user_id(self, token: str) -> Optional[str]:
         """Extract user ID from token (SOURCE — user-controlled)."""
-        claims = self.decode_token(token)
-        return claims.get("sub")
+        claims = self._lookup(token)
+        if claims is None:
+            return None
+        sub = claims.get("sub")
+        # Same rule as decode_token: never hand out the cached objects.
+        return copy.deepcopy(sub) if isinstance(sub, (dict, list)) else sub
+
+    def _lookup(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached claims for `token`, or None if it is invalid."""
+        if token in self._rejected:
+            return None
+        try:
+            return self._cached_decode(token)
+        except (IndexError, ValueError, binascii.Error):
+            self._rejected[token] = None
+            if len(self._rejected) > self._rejected_cache_size:
+                self._rejected.popitem(last=False)
+            return None
+
+    def _reset_caches(self):
+        self._cached_decode = functools.lru_cache(maxsize=self._cache_size)(self._decode)
+        self._rejected: "OrderedDict[str, None]" = OrderedDict()
+
+    @staticmethod
+    def _decode(token: str) -> Dict[str, Any]:
+        """Decode a token's claims, raising if it is malformed."""
+        # Simplified token "decoding" for demo purposes
+        # Only the claims segment is needed; don't split the signature.
+        segment = token.split(".", 2)[1]
+        payload = base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+        claims = json.loads(payload)
+        if not isinstance(claims, dict):
+            raise ValueError("token claims must be a JSON object")
+        return claims
 
 
 class Sanitizer:
@@ -57,9 +254,10 @@ class Sanitizer:
 
         NOTE: This is a naive implementation and does NOT fully prevent XSS.
         """
-        import re
-
-        return re.sub(r"<[^>]*>", "", html)
+        if "<" not in html:
+            # Most input has no markup; a C-level scan beats running the regex.
+            return html
+        return _TAG_RE.sub("", html)
 
     @staticmethod
     def truncate(value: str, max_length: int = 255) -> str:
@@ -84,8 +282,18 @@ class SystemHelper:
         """
         Execute a system command and return its output.
 
+        Commands with no shell syntax are executed directly, skipping the
+        /bin/sh process; anything else still goes through the shell.
+
         `cmd` is a SINK for command-injection.
         """
+        argv = cmd.split(" ")
+        if _PLAIN_COMMAND_RE.fullmatch(cmd) and all(argv):
+            try:
+                return subprocess.run(argv, capture_output=True, text=True).stdout
+            except OSError:
+                # Not an executable (e.g. a shell builtin): let the shell try.
+                pass
         result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
         return result.stdout
 
@@ -96,27 +304,91 @@ class SystemHelper:
 
         `hostname` is a SINK for command-injection.
         """
-        result = subprocess.run(
-            f"ping -c 1 {hostname}", shell=True, capture_output=True, text=True
-        )
-        return result.stdout
+        return SystemHelper.run_command(f"ping -c 1 {hostname}")
+
+    @staticmethod
+    def is_valid_hostname(hostname: str) -> bool:
+        """
+        Return True if `hostname` is an IP address or an RFC 1123 host name.
+
+        Callers can use this to reject input before handing it to
+        `ping_host`, which does not validate its argument itself.
+        """
+        try:
+            ipaddress.ip_address(hostname)
+            return True
+        except ValueError:
+            return _HOSTNAME_RE.match(hostname) is not None
 
     @staticmethod
     def read_file(filepath: str) -> str:
         """
         Read and return the contents of a file.
 
+        Line endings are normalised to "\n", as text-mode `open` does.
+
+        `filepath` is a SINK for path-injection.
+        """
+        text = SystemHelper.read_file_bytes(filepath).decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    @staticmethod
+    def read_file_bytes(filepath: str) -> bytes:
+        """
+        Read and return the raw contents of a file.
+
+        The file is sized with fstat and read into a single buffer, so
+        callers that pass the result straight to a Response skip decoding.
+
         `filepath` is a SINK for path-injection.
         """
-        with open(filepath, "r") as f:
-            return f.read()
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size) if size else b""
+            if len(data) < size or not size:
+                # Short read, or a file that reports no size (e.g. under
+                # /proc): read the remainder until EOF. Bytes appended after
+                # the fstat are not picked up on a full-size read.
+                chunks = [data]
+                while True:
+                    chunk = os.read(fd, 64 * 1024)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        return data
+
+    @staticmethod
+    def open_file(filepath: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Yield the contents of a file in `chunk_size` pieces.
+
+        Only one chunk is held in memory at a time, so large files can be
+        streamed to the client. The file is opened before this returns, so
+        a missing or unreadable file raises here rather than mid-stream.
+
+        `filepath` is a SINK for path-injection.
+        """
+        return _iter_chunks(open(filepath, "rb"), chunk_size)
 
     @staticmethod
     def write_log(logfile: str, message: str):
         """
         Write a message to a log file.
 
+        The write is queued and batched with other pending lines; call
+        `flush_logs()` to wait for it to reach the file.
+
         `message` is a SINK for log-injection.
         """
-        with open(logfile, "a") as f:
-            f.write(message + "\n")
+        _log_writer.submit(logfile, message + "\n")
+
+    @staticmethod
+    def flush_logs():
+        """Block until all queued log lines have been written."""
+        _log_writer.flush()
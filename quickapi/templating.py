@@ -5,8 +5,62 @@ The `render` and `render_string` methods are SINKS for HTML/JS injection (XSS)
 when user-controlled data is passed in without escaping.
 """
 
+import functools
 import os
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Any brace-free name between double braces, as the original str.replace
+# implementation accepted (e.g. "{{user-name}}").
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+class _SafeDict(dict):
+    """format_map context that leaves unknown placeholders as they were."""
+
+    def __missing__(self, key: str) -> str:
+        return "{{" + key + "}}"
+
+
+class _Template:
+    """
+    A template that has been split into literal text and placeholder names.
+
+    `segments` alternates literal, key, literal, key, ..., literal. The same
+    template is also converted once to `str.format_map` syntax ({{key}} ->
+    {key!s}, literal braces doubled), so rendering runs entirely in C and
+    values are converted with str() exactly as on the segment path.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.segments: List[str] = _PLACEHOLDER_RE.split(source)
+        keys = self.segments[1::2]
+        # format_map only takes plain names: digits would be positional
+        # indexes and ".", "[", ":" or "!" would be parsed as field syntax.
+        if not all(key.isidentifier() for key in keys):
+            self._format: Optional[str] = None
+        else:
+            self._format = "".join(
+                seg.replace("{", "{{").replace("}", "}}") if i % 2 == 0 else "{" + seg + "!s}"
+                for i, seg in enumerate(self.segments)
+            )
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Substitute context values (no escaping); unknown keys are left as-is."""
+        if self._format is not None:
+            return self._format.format_map(_SafeDict(context))
+        parts = self.segments[:]
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            parts[i] = str(context[key]) if key in context else "{{" + key + "}}"
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(template_source: str) -> _Template:
+    """Compile a template source once; repeat renders reuse the result."""
+    return _Template(template_source)
 
 
 class TemplateEngine:
@@ -16,8 +70,11 @@ class TemplateEngine:
     This engine does NOT auto-escape output, making it a potential XSS sink.
     """
 
-    def __init__(self, template_dir: str = "templates"):
+    def __init__(self, template_dir: str = "templates", max_cached_files: int = 256):
         self.template_dir = template_dir
+        self._max_cached_files = max_cached_files
+        # template path -> (mtime, size, compiled template)
+        self._compiled: Dict[str, Tuple[float, int, _Template]] = {}
 
     def render(self, template_name: str, context: Dict[str, Any] = None) -> str:
         """
@@ -29,22 +86,34 @@ class TemplateEngine:
         """
         context = context or {}
         template_path = os.path.join(self.template_dir, template_name)
-        with open(template_path, "r") as f:
-            template_content = f.read()
-        return self._interpolate(template_content, context)
+        return self._load(template_path).render(context)
 
     def render_string(self, template_str: str, context: Dict[str, Any] = None) -> str:
         """
         Render an inline template string with the given context.
 
         `template_str` is a SINK for html-injection if it contains user input.
+        Compiled templates are cached, so views should pass a constant string.
         """
         context = context or {}
-        return self._interpolate(template_str, context)
-
-    def _interpolate(self, template: str, context: Dict[str, Any]) -> str:
-        """Replace {{key}} placeholders with context values (no escaping)."""
-        result = template
-        for key, value in context.items():
-            result = result.replace("{{" + key + "}}", str(value))
-        return result
+        return self._compile(template_str).render(context)
+
+    def _compile(self, template_str: str) -> _Template:
+        """Return the cached compiled form of `template_str`."""
+        return _compile(template_str)
+
+    def _load(self, template_path: str) -> _Template:
+        """
+        Return the compiled template for a file, reading and compiling it
+        only when it is new or its mtime/size has changed since last time.
+        """
+        stat = os.stat(template_path)
+        cached = self._compiled.get(template_path)
+        if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+        with open(template_path, "r") as f:
+            template = _Template(f.read())
+        if cached is None and len(self._compiled) >= self._max_cached_files:
+            self._compiled.pop(next(iter(self._compiled)))
+        self._compiled[template_path] = (stat.st_mtime, stat.st_size, template)
+        return template
@@ -5,9 +5,12 @@ These are SUMMARIES — they transform data while preserving taint.
 The CodeQL model editor should model these so taint flows through them.
 """
 
-import json
-import copy
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from quickapi import _json
 
 
 class DataTransformer:
@@ -20,22 +23,42 @@ class DataTransformer:
     @staticmethod
     def to_json(data: Any) -> str:
         """Convert data to a JSON string (SUMMARY: value flows through)."""
-        return json.dumps(data)
+        return _json.dumps(data)
 
     @staticmethod
     def from_json(json_str: str) -> Any:
         """Parse a JSON string into Python objects (SUMMARY: taint flows through)."""
-        return json.loads(json_str)
+        return _json.loads(json_str)
 
     @staticmethod
     def merge_dicts(base: Dict, override: Dict) -> Dict:
         """
         Merge two dicts, with `override` taking precedence.
 
+        The merge is shallow: nested values are shared with the inputs. Use
+        `deep_merge` when nested dicts should be merged as well.
+
         SUMMARY: taint from either input flows to the output.
         """
-        result = copy.deepcopy(base)
-        result.update(override)
+        return {**base, **override}
+
+    @staticmethod
+    def deep_merge(base: Dict, override: Dict) -> Dict:
+        """
+        Merge two dicts recursively, with `override` taking precedence.
+
+        Where both sides hold a dict under the same key, those dicts are
+        merged too; neither input is modified.
+
+        SUMMARY: taint from either input flows to the output.
+        """
+        result = dict(base)
+        for key, value in override.items():
+            current = result.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                result[key] = DataTransformer.deep_merge(current, value)
+            else:
+                result[key] = value
         return result
 
     @staticmethod
@@ -71,22 +94,105 @@ class CacheManager:
     """
     In-memory cache manager.
 
+    Entries expire after their TTL, and the least recently used entry is
+    evicted once `max_entries` is reached, so keys derived from request
+    data cannot grow the cache without bound.
+
+    Entries can be tagged and dropped together with `invalidate`. Tag
+    invalidations are debounced: within `invalidation_debounce` seconds of
+    the last one they are only recorded, and applied together once the
+    cooldown has passed, so a steady trickle of writes does not keep
+    emptying the cache.
+
     Taint flows through the cache: data stored via `set` flows out via `get`.
     """
 
-    def __init__(self):
-        self._store: Dict[str, Any] = {}
-
-    def set(self, key: str, value: Any, ttl: int = 300):
+    __slots__ = (
+        "_store", "_max_entries", "_tags", "_inv_cooldown", "_last_invalidated",
+        "_pending_inv", "_lock",
+    )
+
+    def __init__(self, max_entries: int = 1024, invalidation_debounce: float = 300.0):
+        self._store: "OrderedDict[str, Tuple[Any, float, Tuple[str, ...]]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._tags: Dict[str, Set[str]] = {}
+        self._inv_cooldown = invalidation_debounce
+        self._last_invalidated = float("-inf")
+        self._pending_inv: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def set(self, key: str, value: Any, ttl: int = 300, tags: Iterable[str] = ()):
         """Store a value in the cache (SUMMARY: taint flows in)."""
-        self._store[key] = value
+        tags = tuple(tags)
+        with self._lock:
+            self._remove(key)
+            self._store[key] = (value, time.monotonic() + ttl, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            if len(self._store) > self._max_entries:
+                self._remove(next(iter(self._store)))
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value from the cache (SUMMARY: taint flows out)."""
-        return self._store.get(key, default)
+        with self._lock:
+            entry = self._live_entry(key)
+        return default if entry is None else entry[0]
 
-    def get_or_compute(self, key: str, compute_func) -> Any:
+    def get_or_compute(self, key: str, compute_func: Callable[[], Any], ttl: int = 300,
+                       tags: Iterable[str] = ()) -> Any:
         """Get from cache or compute and store the result."""
-        if key not in self._store:
-            self._store[key] = compute_func()
-        return self._store[key]
+        with self._lock:
+            entry = self._live_entry(key)
+        if entry is not None:
+            return entry[0]
+        value = compute_func()
+        self.set(key, value, ttl, tags)
+        return value
+
+    def invalidate(self, tags: Iterable[str], force: bool = False):
+        """
+        Drop every entry carrying one of `tags`.
+
+        Debounced unless `force` is set; use `force` when the caller must
+        not observe stale data afterwards.
+        """
+        with self._lock:
+            self._pending_inv.update(tags)
+            if force:
+                self._apply_pending()
+            else:
+                self._apply_pending_if_due()
+
+    def _live_entry(self, key: str) -> Optional[Tuple[Any, float, Tuple[str, ...]]]:
+        """Return the unexpired entry for `key`, marking it recently used."""
+        self._apply_pending_if_due()
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            return None
+        self._store.move_to_end(key)
+        return entry
+
+    def _apply_pending_if_due(self):
+        if self._pending_inv and time.monotonic() - self._last_invalidated >= self._inv_cooldown:
+            self._apply_pending()
+
+    def _apply_pending(self):
+        for tag in self._pending_inv:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+        self._pending_inv.clear()
+        self._last_invalidated = time.monotonic()
+
+    def _remove(self, key: str):
+        entry = self._store.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
@@ -0,0 +1,39 @@
+import json
+import unittest
+
+from quickapi.database import DatabaseConnection, ResultSet
+from quickapi.response import JSONResponse
+from quickapi.utils import DataTransformer
+
+
+class ResultSetTests(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConnection(":memory:")
+        self.db.connect()
+        self.db.execute_raw("CREATE TABLE users (id INTEGER, username TEXT)")
+        self.db.execute_raw("INSERT INTO users VALUES (1, 'alice'), (2, 'bob')")
+        self.rows = self.db.execute_query("SELECT id, username FROM users ORDER BY id")
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_to_json_serializes_query_results(self):
+        encoded = DataTransformer.to_json({"users": self.rows})
+        self.assertEqual(
+            json.loads(encoded),
+            {"users": [{"id": 1, "username": "alice"}, {"id": 2, "username": "bob"}]},
+        )
+
+    def test_json_response_serializes_query_results(self):
+        self.assertEqual(json.loads(JSONResponse(self.rows).body), [
+            {"id": 1, "username": "alice"}, {"id": 2, "username": "bob"},
+        ])
+
+    def test_compares_equal_to_list_of_dicts(self):
+        self.assertEqual(self.rows, [{"id": 1, "username": "alice"}, {"id": 2, "username": "bob"}])
+        self.assertNotEqual(self.rows, [{"id": 1, "username": "alice"}])
+        self.assertEqual(self.rows, ResultSet(["id", "username"], [(1, "alice"), (2, "bob")]))
+
+
+if __name__ == "__main__":
+    unittest.main()